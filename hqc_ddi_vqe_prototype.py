@@ -14,11 +14,68 @@ This file implements all 4 Design Principles:
 """
 
 import json
+import logging
+import multiprocessing
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List
+from functools import cache, lru_cache
+from itertools import repeat
+from types import MappingProxyType
+from typing import Dict, List, Mapping
 import numpy as np
 from scipy.optimize import minimize
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; kernels then run as plain Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    import jax
+    import jax.numpy as jnp
+    JAX_AVAILABLE = True
+except ImportError:  # JAX is optional; VQE then falls back to COBYLA
+    JAX_AVAILABLE = False
+
+try:
+    import ml_dtypes
+except ImportError:  # Only needed for precision="bf16"
+    ml_dtypes = None
+
+try:
+    import cupy as cp
+    CUPY_AVAILABLE = True
+except ImportError:  # CuPy is optional; "cuda_q" then evaluates on the CPU
+    CUPY_AVAILABLE = False
+
+try:
+    from cma import CMAEvolutionStrategy
+    CMA_AVAILABLE = True
+except ImportError:  # pycma is optional; only needed for optimizer="cma"
+    CMA_AVAILABLE = False
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; streamed history then uses json
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Level below DEBUG for high-volume events such as granted access checks
+TRACE = 5
+logging.addLevelName(TRACE, "TRACE")
+
 
 # ============================================================================
 # DP2: DATA GOVERNANCE MANAGER
@@ -30,18 +87,24 @@ class DataGovernanceManager:
     Implements ISO 11179 metadata standards and compliance logging.
     """
     
-    ROLES = {
+    ROLES = {role: frozenset(actions) for role, actions in {
         "data_owner": ["read", "write", "approve", "delete"],
         "quantum_specialist": ["read", "execute_quantum", "write_results"],
         "classical_specialist": ["read", "execute_classical", "write_results"],
         "data_steward": ["read", "validate_quality", "audit"],
         "compliance_officer": ["read", "audit", "policy_enforcement"]
-    }
+    }.items()}
+    
+    # Flattened (role, action) permission table for single-lookup checks
+    _ROLE_ACTION = frozenset(
+        (role, action) for role, actions in ROLES.items() for action in actions
+    )
     
     def __init__(self):
         """Initialize governance manager with empty metadata store and audit log."""
         self.metadata_store = {}
-        self.audit_log = []
+        self._log_buf = []
+        self._flushed = 0
     
     def create_dataset_metadata(self, dataset_id: str, owner: str, purpose: str, 
                                 classification: str = "internal") -> Dict:
@@ -55,11 +118,13 @@ class DataGovernanceManager:
             classification: Sensitivity level (public, internal, confidential, regulated)
         
         Returns:
-            Dictionary containing metadata record
+            Dictionary containing metadata record. The creation time is stored
+            as integer nanoseconds ("created_timestamp_ns"); see export_metadata
+            for the ISO-formatted record
         """
         metadata = {
             "dataset_id": dataset_id,
-            "created_timestamp": datetime.now().isoformat(),
+            "created_timestamp_ns": time.time_ns(),
             "data_owner": owner,
             "purpose": purpose,
             "classification": classification,
@@ -85,16 +150,16 @@ class DataGovernanceManager:
         Returns:
             True if access granted, False otherwise
         """
-        if role not in self.ROLES:
-            self._audit_log("DENIED", user, f"Invalid role: {role}")
-            return False
-        
-        if action not in self.ROLES[role]:
-            self._audit_log("DENIED", user, f"Role {role} cannot perform {action}")
+        allowed = (role, action) in self._ROLE_ACTION
+        if not allowed:
+            if role not in self.ROLES:
+                self._audit_log("DENIED", user, f"Invalid role: {role}")
+            else:
+                self._audit_log("DENIED", user, f"Role {role} cannot perform {action}")
             return False
         
         self._audit_log("GRANTED", user, f"Action {action} approved for role {role}")
-        return True
+        return allowed
     
     def record_data_quality(self, dataset_id: str, quality_metrics: Dict):
         """
@@ -116,23 +181,340 @@ class DataGovernanceManager:
             avg_quality = np.mean(list(quality_metrics.values()))
             self.metadata_store[dataset_id]["quality_score"] = avg_quality
     
+    def export_metadata(self, dataset_id: str) -> Dict:
+        """
+        Metadata record with its creation time formatted for export.
+        
+        Args:
+            dataset_id: Dataset identifier
+        
+        Returns:
+            Copy of the stored record with an ISO 8601 "created_timestamp"
+            in place of "created_timestamp_ns"
+        """
+        record = dict(self.metadata_store[dataset_id])
+        record["created_timestamp"] = self._fmt_ts(record.pop("created_timestamp_ns"))
+        return record
+    
+    @property
+    def audit_log(self) -> List[Dict]:
+        """
+        Audit trail as a list of event records.
+        
+        Returns:
+            List of dictionaries with timestamp, event_type, user and details
+        """
+        return [
+            {"timestamp": self._fmt_ts(ts), "event_type": event_type,
+             "user": user, "details": details}
+            for ts, event_type, user, details in self._log_buf
+        ]
+    
+    @staticmethod
+    def _fmt_ts(ns: int) -> str:
+        """
+        Format an integer nanosecond timestamp as local-time ISO 8601.
+        
+        Args:
+            ns: Nanoseconds since the epoch (time.time_ns())
+        
+        Returns:
+            ISO 8601 timestamp string
+        """
+        return datetime.fromtimestamp(ns / 1e9).isoformat()
+    
+    def flush_audit_log(self):
+        """Write all audit events recorded since the last flush to stdout in one call."""
+        pending = self._log_buf[self._flushed:]
+        if pending:
+            sys.stdout.write("".join(
+                f"[{event_type}] {user}: {details}\n"
+                for _, event_type, user, details in pending
+            ))
+            self._flushed = len(self._log_buf)
+    
     def _audit_log(self, event_type: str, user: str, details: str):
         """
         Log all governance events for compliance and auditing.
         
+        Events are buffered (see flush_audit_log) and emitted through the module
+        logger: granted checks at TRACE level, everything else at DEBUG.
+        Timestamps are kept as integer nanoseconds and only formatted when the
+        audit log is read.
+        
         Args:
             event_type: Type of event (CREATE, GRANTED, DENIED, etc.)
             user: User performing action
             details: Event details
         """
-        log_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "event_type": event_type,
-            "user": user,
-            "details": details
-        }
-        self.audit_log.append(log_entry)
-        print(f"[{event_type}] {user}: {details}")
+        self._log_buf.append((time.time_ns(), event_type, user, details))
+        level = TRACE if event_type == "GRANTED" else logging.DEBUG
+        if logger.isEnabledFor(level):
+            logger.log(level, "[%s] %s: %s", event_type, user, details)
+
+
+# ============================================================================
+# STATE-VECTOR KERNELS (used by DP1 quantum evaluation)
+# ============================================================================
+
+@njit(cache=True, fastmath=True, inline="always")
+def _apply_two_local(params: np.ndarray, n_params: int, n_qubits: int,
+                     depth: int) -> np.ndarray:
+    """
+    Prepare the two-local ansatz state |psi(params)> starting from |0...0>.
+    
+    Each parameter drives one RY rotation, cycling over the qubits. After every
+    complete rotation layer (up to `depth` layers) a full-entanglement CZ block
+    is applied. RY and CZ keep all amplitudes real.
+    
+    Inlined into its callers, so when `n_params` and `depth` are compile-time
+    constants (see _get_specialized_kernel) the loops can be fully unrolled.
+    
+    Args:
+        params: Rotation angles
+        n_params: Number of angles to apply (len(params))
+        n_qubits: Number of qubits
+        depth: Number of entangling blocks (ansatz repetitions)
+    
+    Returns:
+        Real state vector of length 2^n_qubits (same dtype as params)
+    """
+    dim = 1 << n_qubits
+    psi = np.zeros(dim, dtype=params.dtype)
+    psi[0] = 1.0
+    layers = 0
+    for k in range(n_params):
+        qubit = k % n_qubits
+        bit = 1 << qubit
+        c = np.cos(0.5 * params[k])
+        s = np.sin(0.5 * params[k])
+        for i in range(dim):
+            if i & bit == 0:
+                a0 = psi[i]
+                a1 = psi[i | bit]
+                psi[i] = c * a0 - s * a1
+                psi[i | bit] = s * a0 + c * a1
+        if qubit == n_qubits - 1 and layers < depth:
+            # CZ on every qubit pair: sign flips once per pair of set bits
+            for i in range(dim):
+                ones = 0
+                j = i
+                while j:
+                    ones += j & 1
+                    j >>= 1
+                if (ones * (ones - 1) // 2) % 2 == 1:
+                    psi[i] = -psi[i]
+            layers += 1
+    return psi
+
+
+@lru_cache(maxsize=32)
+def _get_specialized_kernel(n_params: int, reps: int):
+    """
+    Build a Numba energy kernel specialized for a fixed ansatz shape.
+    
+    `n_params` and `reps` are frozen into the compiled code as constants, so
+    the rotation and entangling loops have known trip counts. Compilation is
+    paid once per shape per process (and reused from the on-disk cache).
+    
+    Args:
+        n_params: Number of circuit parameters
+        reps: Number of ansatz repetitions
+    
+    Returns:
+        Compiled kernel(params, hamiltonian) -> <psi(params)|H|psi(params)>
+    """
+    @njit(cache=True, fastmath=True)
+    def kernel(params, hamiltonian):
+        dim = hamiltonian.shape[0]
+        n_qubits = 0
+        while (1 << n_qubits) < dim:
+            n_qubits += 1
+        psi = _apply_two_local(params, n_params, n_qubits, reps).astype(hamiltonian.dtype)
+        return np.dot(psi, hamiltonian @ psi)
+    
+    return kernel
+
+
+@njit(cache=True, fastmath=True)
+def _batch_two_local(params_batch: np.ndarray, n_qubits: int, depth: int) -> np.ndarray:
+    """
+    Prepare two-local ansatz states for a batch of parameter vectors.
+    
+    Args:
+        params_batch: (batch, n_params) matrix of rotation angles
+        n_qubits: Number of qubits
+        depth: Number of entangling blocks (ansatz repetitions)
+    
+    Returns:
+        (batch, 2^n_qubits) matrix of state vectors, one per row
+    """
+    batch, n_params = params_batch.shape
+    states = np.empty((batch, 1 << n_qubits), dtype=params_batch.dtype)
+    for b in range(batch):
+        states[b] = _apply_two_local(params_batch[b], n_params, n_qubits, depth)
+    return states
+
+
+def _contract_energies(states: np.ndarray, hamiltonian: np.ndarray) -> np.ndarray:
+    """
+    Row-wise energies <psi_b|H|psi_b> for a matrix of prepared states.
+    
+    Used by both the single-vector and batched NumPy paths so they agree. For
+    reduced-precision (bf16) Hamiltonians only the H-side operand is cast to
+    the storage type; the projection is upcast to fp32 and contracted against
+    the fp32 states.
+    
+    Args:
+        states: (batch, 2^n) matrix of state vectors (fp32 or fp64)
+        hamiltonian: Problem Hamiltonian
+    
+    Returns:
+        Array of energies, one per row of states
+    """
+    if hamiltonian.dtype in (np.float32, np.float64):
+        states = states.astype(hamiltonian.dtype, copy=False)
+        return np.einsum("bj,bj->b", states @ hamiltonian, states)
+    projected = (states.astype(hamiltonian.dtype) @ hamiltonian).astype(np.float32)
+    return np.einsum("bj,bj->b", projected, states.astype(np.float32, copy=False))
+
+
+@lru_cache(maxsize=32)
+def _cz_phases(n_qubits: int) -> np.ndarray:
+    """
+    Diagonal of the full-entanglement CZ block as a +/-1 vector.
+    
+    Memoized per qubit count; the returned array is read-only.
+    
+    Args:
+        n_qubits: Number of qubits
+    
+    Returns:
+        Phase vector of length 2^n_qubits
+    """
+    ones = np.array([bin(i).count("1") for i in range(1 << n_qubits)])
+    phases = np.where((ones * (ones - 1) // 2) % 2 == 1, -1.0, 1.0)
+    phases.flags.writeable = False
+    return phases
+
+
+def _two_local_statevector(params, n_qubits: int, depth: int, xp=np,
+                           phases=None, psi0=None):
+    """
+    Array-API version of _apply_two_local without in-place updates.
+    
+    Suitable for tracing by JAX (xp=jax.numpy); produces the same state as
+    the Numba kernel.
+    
+    Args:
+        params: Rotation angles
+        n_qubits: Number of qubits
+        depth: Number of entangling blocks (ansatz repetitions)
+        xp: Array module to build the state with
+        phases: Precomputed CZ phase vector in xp (built if omitted)
+        psi0: Precomputed |0...0> state in xp (built if omitted)
+    
+    Returns:
+        Real state vector of length 2^n_qubits
+    """
+    dim = 1 << n_qubits
+    if phases is None:
+        phases = xp.asarray(_cz_phases(n_qubits))
+    psi = xp.asarray(np.eye(1, dim)[0]) if psi0 is None else psi0
+    layers = 0
+    for k in range(params.shape[0]):
+        qubit = k % n_qubits
+        c = xp.cos(0.5 * params[k])
+        s = xp.sin(0.5 * params[k])
+        # Split amplitudes on the target qubit: axis 1 is the qubit's bit value
+        pairs = psi.reshape(dim >> (qubit + 1), 2, 1 << qubit)
+        a0, a1 = pairs[:, 0, :], pairs[:, 1, :]
+        psi = xp.stack([c * a0 - s * a1, s * a0 + c * a1], axis=1).reshape(dim)
+        if qubit == n_qubits - 1 and layers < depth:
+            psi = psi * phases
+            layers += 1
+    return psi
+
+
+def _energy_jax(params, hamiltonian, depth: int):
+    """
+    JAX port of the energy evaluation, differentiable w.r.t. params.
+    
+    Args:
+        params: Circuit parameters (JAX array)
+        hamiltonian: Problem Hamiltonian (JAX array)
+        depth: Number of ansatz repetitions (static)
+    
+    Returns:
+        Energy expectation value as a JAX scalar
+    """
+    n_qubits = hamiltonian.shape[0].bit_length() - 1
+    psi = _two_local_statevector(params, n_qubits, depth, xp=jnp)
+    return psi @ (hamiltonian @ psi)
+
+
+if JAX_AVAILABLE:
+    # Jitted once per process and shared by every orchestrator; L-BFGS-B
+    # gets the energy and its analytic gradient from one forward pass
+    _energy_and_grad_jit = jax.jit(jax.value_and_grad(_energy_jax), static_argnums=2)
+
+
+def _random_hamiltonian(n_qubits: int, seed: int, precision: str) -> np.ndarray:
+    """
+    Build the random demo Hamiltonian for a problem.
+    
+    The returned array is marked read-only so it can be shared between callers.
+    
+    Args:
+        n_qubits: Number of qubits
+        seed: Seed for the random matrix entries
+        precision: Key of HybridQuantumOrchestrator.PRECISIONS
+    
+    Returns:
+        (2^n) x (2^n) real symmetric matrix in the requested precision
+    """
+    # Random Hamiltonian (in production, would be molecular Hamiltonian)
+    rng = np.random.default_rng(seed)
+    dim = 1 << n_qubits
+    hamiltonian = rng.standard_normal((dim, dim), dtype=np.float32)
+    hamiltonian = 0.5 * (hamiltonian + hamiltonian.T)
+    hamiltonian = np.asarray(hamiltonian, dtype=HybridQuantumOrchestrator.PRECISIONS[precision])
+    hamiltonian.setflags(write=False)
+    return hamiltonian
+
+
+@lru_cache(maxsize=16)
+def _build_hamiltonian(n_qubits: int, seed: int, precision: str) -> np.ndarray:
+    """
+    Process-wide memoized _random_hamiltonian for explicitly seeded problems.
+    
+    Args:
+        n_qubits: Number of qubits
+        seed: Seed for the random matrix entries
+        precision: Key of HybridQuantumOrchestrator.PRECISIONS
+    
+    Returns:
+        Shared, read-only Hamiltonian matrix
+    """
+    return _random_hamiltonian(n_qubits, seed, precision)
+
+
+@cache
+def _build_ansatz(reps: int) -> Mapping:
+    """
+    Build (and memoize) the two-local ansatz description.
+    
+    Args:
+        reps: Number of ansatz repetitions
+    
+    Returns:
+        Read-only ansatz description mapping, shared between callers
+    """
+    return MappingProxyType({
+        "type": "two_local",
+        "reps": reps,
+        "entanglement": "full"
+    })
 
 
 # ============================================================================
@@ -146,7 +528,20 @@ class HybridQuantumOrchestrator:
     Demonstrates loose coupling between classical optimizer and quantum backend.
     """
     
-    def __init__(self, backend_type: str = "qiskit_simulator"):
+    EVAL_CACHE_SIZE = 4096  # Max parameter vectors memoized per workflow
+    
+    OPTIMIZERS = ("cobyla", "lbfgsb", "cma")
+    
+    HISTORY_WINDOW = 100  # Iterations kept in memory when history is streamed
+    
+    PRECISIONS = {
+        "fp64": np.float64,
+        "fp32": np.float32,
+        "bf16": ml_dtypes.bfloat16 if ml_dtypes is not None else None
+    }
+    
+    def __init__(self, backend_type: str = "qiskit_simulator", demo_mode: bool = False,
+                 seed: int = None):
         """
         Initialize orchestrator with specified quantum backend.
         
@@ -156,11 +551,42 @@ class HybridQuantumOrchestrator:
                 - "braket": AWS Braket
                 - "cuda_q": NVIDIA CUDA-Q
                 - "ionq": IonQ hardware
+            demo_mode: Return pre-generated random energies instead of
+                evaluating the ansatz state against the Hamiltonian
+            seed: Seed for the orchestrator's random generator (random if None)
         """
         self.backend_type = backend_type
+        self.demo_mode = demo_mode
         self.execution_history = []
+        self._rng = np.random.default_rng(seed)
+        # Hamiltonian seed used when problem_config has no "seed"
+        self._hamiltonian_seed = int(self._rng.integers(2**32))
+        # Hamiltonians built from _hamiltonian_seed, kept only for this orchestrator
+        self._hamiltonian_cache = {}
+        self._device_ham_cache = {}
+        # (n_qubits, dtype) -> (CZ phases, |0...0>) resident on the GPU
+        self._device_ansatz_cache = {}
+        self.precision = "fp32"
+        
+        # "cuda_q" keeps the Hamiltonian on the GPU when CuPy is installed
+        self._use_gpu = backend_type == "cuda_q" and CUPY_AVAILABLE
+        if self._use_gpu:
+            self._cuda_stream = cp.cuda.Stream(non_blocking=True)
+        self._eval_cache = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._key_buf = np.empty(0)  # Scratch for rounding cache keys in place
+        
+        if NUMBA_AVAILABLE and not demo_mode:
+            # Trigger JIT compilation up front (cached on disk across runs).
+            # Hamiltonians are read-only, which Numba types separately from
+            # writable arrays, so warm up with a read-only matrix.
+            warmup_hamiltonian = np.eye(4, dtype=np.float32)
+            warmup_hamiltonian.setflags(write=False)
+            _get_specialized_kernel(4, 2)(np.zeros(4, dtype=np.float32), warmup_hamiltonian)
     
-    def execute_vqe_workflow(self, problem_config: Dict, max_iterations: int = 50) -> Dict:
+    def execute_vqe_workflow(self, problem_config: Dict, max_iterations: int = 50,
+                             seed: int = None, history_path: str = None) -> Dict:
         """
         Execute VQE (Variational Quantum Eigensolver) hybrid workflow.
         
@@ -176,15 +602,34 @@ class HybridQuantumOrchestrator:
                 - num_parameters: Number of parameters to optimize
                 - ansatz_reps: Number of ansatz repetitions
                 - backend: Quantum backend to use
+                - precision: Hamiltonian storage precision, "fp32" (default),
+                  "fp64" or "bf16" (requires ml_dtypes)
+                - seed: Seed of the random Hamiltonian; runs given the same
+                  (n_qubits, seed, precision) share one process-wide matrix
+                - optimizer: "lbfgsb" (default when JAX is available; uses
+                  batched finite-difference gradients without JAX or with
+                  precision="fp64"), "cobyla"
+                  (default otherwise) or "cma" (CMA-ES, requires pycma)
             max_iterations: Maximum number of optimization iterations
+            seed: Seed for the initial parameters (orchestrator generator if None);
+                see problem_config["seed"] for the Hamiltonian
+            history_path: Append every evaluation to this NDJSON file as it
+                happens; the returned history then only holds the latest
+                HISTORY_WINDOW evaluations
         
         Returns:
             Dictionary containing VQE results:
                 - backend: Backend used
                 - problem: Problem configuration
                 - optimal_params: Optimized parameters
+                - optimizer: Classical optimizer used
                 - minimum_energy: Lowest energy found
-                - iterations: Convergence history
+                - iterations: Convergence history as arrays
+                    {"params": (n_evals, n_params), "energy": (n_evals,),
+                     "first_iteration": index of the first row}
+                - cache_stats: Quantum evaluation cache hits/misses, or None
+                  for JAX L-BFGS-B (every point needs a gradient, which the
+                  energy cache cannot supply)
                 - success: Whether optimization converged
         """
         print(f"\n📊 Starting VQE workflow with backend: {self.backend_type}")
@@ -192,47 +637,390 @@ class HybridQuantumOrchestrator:
         # Step 1: Classical preprocessing - Define Hamiltonian and Ansatz
         hamiltonian = self._construct_hamiltonian(problem_config)
         ansatz = self._construct_ansatz(problem_config)
-        init_params = np.random.random(problem_config.get("num_parameters", 4))
         
-        iteration_history = []
+        workflow_result = self._run_vqe(problem_config, hamiltonian, ansatz,
+                                        max_iterations, seed, history_path)
+        self.execution_history.append(workflow_result)
+        return workflow_result
+    
+    def execute_vqe_workflow_multistart(self, problem_config: Dict, n_starts: int = 4,
+                                        max_iterations: int = 50,
+                                        max_workers: int = None) -> Dict:
+        """
+        Execute several independent VQE runs in parallel and keep the best one.
+        
+        Each start optimizes the same Hamiltonian from different random initial
+        parameters, which helps escape barren plateaus and local minima. Starts
+        share no state, so they run in separate processes and scale close to
+        linearly up to the number of cores.
+        
+        To avoid oversubscribing cores, limit BLAS threading inside the workers,
+        e.g. export OMP_NUM_THREADS=1 before starting Python (or on real
+        simulators, backend.set_options(max_parallel_threads=1)).
+        
+        Args:
+            problem_config: Problem configuration (see execute_vqe_workflow)
+            n_starts: Number of independent optimizations
+            max_iterations: Maximum number of optimization iterations per start
+            max_workers: Worker processes (defaults to number of CPUs)
+        
+        Returns:
+            Result of the lowest-energy start (see execute_vqe_workflow), plus:
+                - n_starts: Number of starts executed
+                - start_energies: Minimum energy reached by each start
+        """
+        print(f"\n📊 Starting {n_starts}-start VQE workflow with backend: {self.backend_type}")
+        
+        # Pin the Hamiltonian seed so every worker rebuilds the same problem
+        problem_config = {**problem_config,
+                          "seed": problem_config.get("seed", self._hamiltonian_seed)}
+        seeds = self._rng.integers(0, 2**32, size=n_starts).tolist()
+        
+        # Spawn rather than fork: JAX's thread pools and CUDA contexts in this
+        # process do not survive fork and can deadlock the workers
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as executor:
+            results = list(executor.map(
+                _run_one_vqe, repeat(problem_config), seeds, repeat(max_iterations),
+                repeat(self.backend_type), repeat(self.demo_mode)
+            ))
+        
+        best = min(results, key=lambda r: r["minimum_energy"])
+        best["n_starts"] = n_starts
+        best["start_energies"] = [r["minimum_energy"] for r in results]
+        
+        self.execution_history.append(best)
+        return best
+    
+    def _run_vqe(self, problem_config: Dict, hamiltonian: np.ndarray, ansatz: Dict,
+                 max_iterations: int, seed: int = None, history_path: str = None) -> Dict:
+        """
+        Run one classical optimization loop against the quantum backend.
+        
+        Args:
+            problem_config: Problem configuration
+            hamiltonian: Problem Hamiltonian
+            ansatz: Circuit structure
+            max_iterations: Maximum number of optimization iterations
+            seed: Seed for the initial parameters (orchestrator generator if None)
+            history_path: NDJSON file to stream evaluations to (None keeps all in memory)
+        
+        Returns:
+            VQE results dictionary (see execute_vqe_workflow)
+        """
+        rng = self._rng if seed is None else np.random.default_rng(seed)
+        n_params = problem_config.get("num_parameters", 4)
+        init_params = rng.random(n_params)
+        
+        jax_usable = JAX_AVAILABLE and not self.demo_mode and not self._use_gpu
+        optimizer = problem_config.get("optimizer", "lbfgsb" if jax_usable else "cobyla")
+        if optimizer not in self.OPTIMIZERS:
+            raise ValueError(f"Unsupported optimizer: {optimizer}")
+        if optimizer == "lbfgsb" and self.demo_mode:
+            raise ValueError("optimizer='lbfgsb' needs real energies; not available in demo mode")
+        if optimizer == "cma" and not CMA_AVAILABLE:
+            raise ImportError("optimizer='cma' requires the cma (pycma) package")
+        # JAX runs with x64 disabled and would silently downcast an fp64
+        # Hamiltonian, so fp64 uses the Numba kernel with finite differences
+        use_jax = optimizer == "lbfgsb" and jax_usable and hamiltonian.dtype != np.float64
+        if use_jax:
+            jax_hamiltonian = jnp.asarray(hamiltonian)
+        
+        # Cached energies are only valid for this Hamiltonian
+        self._eval_cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        
+        # Preallocate the convergence history as flat arrays (one row per
+        # evaluation) so the optimizer loop does no Python object allocation.
+        # In demo mode the simulated energies are also pre-generated.
+        if self.demo_mode:
+            self._energy_pool = rng.uniform(-0.5, 0.5, size=max_iterations)
+        if history_path is None:
+            self._reset_history(n_params, max_iterations)
+        else:
+            self._reset_history(n_params, self.HISTORY_WINDOW, open(history_path, "ab"))
         
         # Step 2: Define cost function (quantum evaluation within classical optimizer)
         def cost_function(params):
             """
             Cost function for classical optimizer.
-            Calls quantum backend to evaluate energy for given parameters.
+            Calls quantum backend to evaluate energy for given parameters, or
+            for a (batch, n_params) matrix of candidates (one energy per row).
             """
-            energy = self._quantum_evaluate(params, hamiltonian, ansatz)
-            iteration_history.append({
-                "iteration": len(iteration_history),
-                "params": params.tolist(),
-                "energy": float(energy)
-            })
+            if self.demo_mode:
+                count = 1 if params.ndim == 1 else params.shape[0]
+                missing = self._iter + count - len(self._energy_pool)
+                if missing > 0:
+                    self._energy_pool = np.concatenate([
+                        self._energy_pool,
+                        rng.uniform(-0.5, 0.5, size=max(max_iterations, missing))
+                    ])
+                if params.ndim == 1:
+                    energy = self._energy_pool[self._iter]
+                else:
+                    energy = self._energy_pool[self._iter:self._iter + count]
+            else:
+                energy = self._quantum_evaluate(params, hamiltonian, ansatz)
+            self._record_iteration(params, energy)
             return energy
         
-        # Step 3: Classical optimization (COBYLA algorithm)
-        result = minimize(cost_function, init_params, method="COBYLA",
-                         options={"maxiter": max_iterations})
+        def energy_and_gradient(params):
+            """Energy and analytic gradient from JAX autodiff in one pass."""
+            energy, grad = _energy_and_grad_jit(params, jax_hamiltonian, ansatz["reps"])
+            energy = float(energy)
+            self._record_iteration(params, energy)
+            return energy, np.asarray(grad, dtype=np.float64)
         
-        # Step 4: Package results
+        # Central-difference step suited to the Hamiltonian's precision
+        finfo = np.finfo if hamiltonian.dtype in (np.float32, np.float64) else ml_dtypes.finfo
+        fd_step = float(finfo(hamiltonian.dtype).eps) ** (1 / 3)
+        
+        def fd_gradient(params):
+            """Central-difference gradient, all 2*n_params shifts in one batch."""
+            shifts = fd_step * np.eye(n_params)
+            stencil = np.concatenate([params + shifts, params - shifts])
+            energies = self._quantum_evaluate_batch(stencil, hamiltonian, ansatz)
+            return (energies[:n_params] - energies[n_params:]) / (2 * fd_step)
+        
+        # Step 3: Classical optimization
+        try:
+            if optimizer == "lbfgsb":
+                optimal_params, minimum_energy, success = self._drive_lbfgsb(
+                    energy_and_gradient if use_jax else cost_function,
+                    True if use_jax else fd_gradient,
+                    init_params, max_iterations)
+            elif optimizer == "cma":
+                optimal_params, minimum_energy, success = self._drive_cma(
+                    cost_function, init_params, max_iterations,
+                    int(rng.integers(1, 2**31)))
+            else:
+                optimal_params, minimum_energy, success = self._drive_cobyla(
+                    cost_function, init_params, max_iterations)
+        finally:
+            if self._history_file is not None:
+                self._history_file.close()
+                self._history_file = None
+        
+        # Step 4: Package results (history stays as arrays; see to_json)
         workflow_result = {
             "backend": self.backend_type,
             "problem": problem_config,
-            "optimal_params": result.x.tolist(),
-            "minimum_energy": float(result.fun),
-            "iterations": iteration_history,
-            "success": result.success
+            "optimizer": optimizer,
+            "optimal_params": np.asarray(optimal_params).tolist(),
+            "minimum_energy": float(minimum_energy),
+            "iterations": self._history_arrays(),
+            "cache_stats": None if use_jax else {"hits": self._cache_hits,
+                                                 "misses": self._cache_misses},
+            "success": success
         }
-        
-        self.execution_history.append(workflow_result)
         return workflow_result
     
+    def _drive_cobyla(self, cost_function, init_params: np.ndarray,
+                      max_iterations: int):
+        """
+        Derivative-free COBYLA driver (one evaluation per call).
+        
+        Args:
+            cost_function: Energy function of one parameter vector
+            init_params: Initial parameters
+            max_iterations: Maximum number of optimization iterations
+        
+        Returns:
+            Tuple of (optimal parameters, minimum energy, success flag)
+        """
+        result = minimize(cost_function, init_params, method="COBYLA",
+                         options={"maxiter": max_iterations})
+        return result.x, result.fun, bool(result.success)
+    
+    def _drive_lbfgsb(self, cost_function, gradient, init_params: np.ndarray,
+                      max_iterations: int):
+        """
+        Gradient-based L-BFGS-B driver.
+        
+        Args:
+            cost_function: Energy function of one parameter vector
+            gradient: Energy gradient function, or True if cost_function
+                returns (energy, gradient)
+            init_params: Initial parameters
+            max_iterations: Maximum number of optimization iterations
+        
+        Returns:
+            Tuple of (optimal parameters, minimum energy, success flag)
+        """
+        result = minimize(cost_function, init_params, method="L-BFGS-B", jac=gradient,
+                         options={"maxiter": max_iterations})
+        return result.x, result.fun, bool(result.success)
+    
+    def _drive_cma(self, cost_function, init_params: np.ndarray,
+                   max_iterations: int, seed: int):
+        """
+        CMA-ES driver for high-dimensional or non-smooth energy landscapes.
+        
+        Each generation's population is evaluated in a single batched call.
+        max_iterations bounds the number of energy evaluations, but pycma only
+        stops after a full generation, so the budget is rounded up to a whole
+        population (at least one generation runs, even for max_iterations=0).
+        
+        Args:
+            cost_function: Energy function accepting a (batch, n_params) matrix
+            init_params: Initial mean of the search distribution
+            max_iterations: Energy evaluation budget (rounded up to a whole
+                generation)
+            seed: Seed for the CMA-ES sampler
+        
+        Returns:
+            Tuple of (optimal parameters, minimum energy, success flag)
+        """
+        es = CMAEvolutionStrategy(init_params, 0.5, {
+            "maxfevals": max_iterations,
+            "seed": seed,
+            "verbose": -9
+        })
+        while not es.stop():
+            candidates = es.ask()
+            energies = cost_function(np.asarray(candidates))
+            es.tell(candidates, np.asarray(energies, dtype=np.float64).tolist())
+        stop = es.stop()
+        success = "maxfevals" not in stop and "maxiter" not in stop
+        return es.result.xbest, es.result.fbest, success
+    
+    def _reset_history(self, n_params: int, capacity: int, history_file=None):
+        """
+        Preallocate the structure-of-arrays convergence history.
+        
+        Args:
+            n_params: Number of circuit parameters
+            capacity: Initial number of evaluations to reserve (the fixed
+                window size when streaming)
+            history_file: Binary file to stream NDJSON records to, if any
+        """
+        self._params_buf = np.empty((capacity, n_params), dtype=np.float64)
+        self._energy_buf = np.empty(capacity, dtype=np.float64)
+        self._iter = 0
+        self._history_file = history_file
+    
+    def _record_iteration(self, params: np.ndarray, energy):
+        """
+        Append evaluations to the history buffers, growing them if full.
+        
+        When streaming, records are written to the history file and the
+        buffers act as a ring holding only the most recent evaluations.
+        
+        Args:
+            params: Evaluated circuit parameters, one vector or a (batch, n_params) matrix
+            energy: Energy (or array of energies) returned for those parameters
+        """
+        count = 1 if params.ndim == 1 else params.shape[0]
+        if self._history_file is not None:
+            self._stream_iterations(params.reshape(count, -1),
+                                    np.asarray(energy, dtype=np.float64).reshape(count))
+            window = len(self._energy_buf)
+            rows = (self._iter + np.arange(count)[-window:]) % window
+            self._params_buf[rows] = params.reshape(count, -1)[-window:]
+            self._energy_buf[rows] = np.asarray(energy).reshape(count)[-window:]
+            self._iter += count
+            return
+        
+        needed = self._iter + count
+        if needed > len(self._energy_buf):
+            # Optimizers may evaluate more often than maxiter (or maxiter may be 0)
+            capacity = max(2 * len(self._energy_buf), needed, 1)
+            params_buf = np.empty((capacity, self._params_buf.shape[1]), dtype=np.float64)
+            energy_buf = np.empty(capacity, dtype=np.float64)
+            params_buf[:self._iter] = self._params_buf[:self._iter]
+            energy_buf[:self._iter] = self._energy_buf[:self._iter]
+            self._params_buf, self._energy_buf = params_buf, energy_buf
+        # Copied in place, no list boxing
+        self._params_buf[self._iter:self._iter + count, :] = params
+        self._energy_buf[self._iter:self._iter + count] = energy
+        self._iter += count
+    
+    def _stream_iterations(self, params_batch: np.ndarray, energies: np.ndarray):
+        """
+        Append one NDJSON record per evaluation to the history file.
+        
+        Uses orjson, which serializes the NumPy rows directly, when available.
+        
+        Args:
+            params_batch: (count, n_params) matrix of evaluated parameters
+            energies: Energies for those parameters
+        """
+        params_batch = np.ascontiguousarray(params_batch, dtype=np.float64)
+        if orjson is not None:
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+            data = b"".join(
+                orjson.dumps({"iteration": self._iter + i, "params": row, "energy": e},
+                             option=option)
+                for i, (row, e) in enumerate(zip(params_batch, energies.tolist()))
+            )
+        else:
+            data = "".join(
+                json.dumps({"iteration": self._iter + i, "params": row, "energy": e}) + "\n"
+                for i, (row, e) in enumerate(zip(params_batch.tolist(), energies.tolist()))
+            ).encode()
+        self._history_file.write(data)
+    
+    def _history_arrays(self) -> Dict:
+        """
+        Recorded history in evaluation order (the latest window when streamed).
+        
+        Returns:
+            Dictionary with "params" and "energy" arrays and "first_iteration"
+        """
+        window = len(self._energy_buf)
+        if self._iter <= window:
+            return {
+                "params": self._params_buf[:self._iter],
+                "energy": self._energy_buf[:self._iter],
+                "first_iteration": 0
+            }
+        # Ring buffer wrapped: oldest retained row sits at the write position
+        order = (self._iter + np.arange(window)) % window
+        return {
+            "params": self._params_buf[order],
+            "energy": self._energy_buf[order],
+            "first_iteration": self._iter - window
+        }
+    
+    @staticmethod
+    def to_json(workflow_result: Dict) -> str:
+        """
+        Serialize a workflow result, converting NumPy arrays to lists.
+        
+        Args:
+            workflow_result: Result returned by execute_vqe_workflow
+        
+        Returns:
+            JSON string
+        """
+        def default(obj):
+            if isinstance(obj, (np.ndarray, np.generic)):
+                return obj.tolist()
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+        
+        return json.dumps(workflow_result, default=default)
+    
     def _construct_hamiltonian(self, problem_config: Dict) -> np.ndarray:
         """
         Construct problem Hamiltonian (energy operator).
         
         In quantum chemistry, the Hamiltonian represents the total energy of a system.
-        For n qubits, creates a (2^n) x (2^n) matrix.
+        For n qubits, creates a (2^n) x (2^n) real symmetric (Hermitian) matrix.
+        The matrix is read-only and reused by repeated workflows instead of
+        being re-allocated and re-randomized.
+        
+        With an explicit "seed" in problem_config it is memoized per
+        (n_qubits, seed, precision) across all orchestrators in the process.
+        Otherwise the orchestrator's own seed is used and the matrix is cached
+        on this orchestrator only.
+        
+        Energy evaluation is memory-bandwidth bound, so the matrix is stored in
+        reduced precision (fp32 by default). bf16 halves storage again but is
+        slower to evaluate with NumPy, which has no BLAS path for ml_dtypes
+        and contracts it in a scalar loop. On the "cuda_q" backend with CuPy
+        installed it is kept resident on the GPU (bf16 is upcast to fp32 there,
+        CuPy has no bfloat16 type).
         
         Args:
             problem_config: Problem configuration
@@ -241,10 +1029,34 @@ class HybridQuantumOrchestrator:
             Hamiltonian matrix as numpy array
         """
         n_qubits = problem_config.get("n_qubits", 2)
-        # Create random Hamiltonian (in production, would be molecular Hamiltonian)
-        return np.random.random((2**n_qubits, 2**n_qubits))
+        self.precision = problem_config.get("precision", "fp32")
+        if self.precision not in self.PRECISIONS:
+            raise ValueError(f"Unsupported precision: {self.precision}")
+        dtype = self.PRECISIONS[self.precision]
+        if dtype is None:
+            raise ImportError("precision='bf16' requires the ml_dtypes package")
+        
+        seed = problem_config.get("seed")
+        if seed is not None:
+            key = (n_qubits, seed, self.precision)
+            hamiltonian = _build_hamiltonian(*key)
+        else:
+            key = (n_qubits, self._hamiltonian_seed, self.precision)
+            hamiltonian = self._hamiltonian_cache.get(key)
+            if hamiltonian is None:
+                hamiltonian = _random_hamiltonian(*key)
+                self._hamiltonian_cache[key] = hamiltonian
+        if self._use_gpu:
+            device_hamiltonian = self._device_ham_cache.get(key)
+            if device_hamiltonian is None:
+                if dtype not in (np.float32, np.float64):
+                    dtype = np.float32
+                device_hamiltonian = cp.asarray(hamiltonian, dtype=dtype)
+                self._device_ham_cache[key] = device_hamiltonian
+            return device_hamiltonian
+        return hamiltonian
     
-    def _construct_ansatz(self, problem_config: Dict) -> Dict:
+    def _construct_ansatz(self, problem_config: Dict) -> Mapping:
         """
         Construct parameterized quantum circuit (ansatz).
         
@@ -255,35 +1067,146 @@ class HybridQuantumOrchestrator:
             problem_config: Problem configuration
         
         Returns:
-            Ansatz description dictionary
+            Ansatz description (shared, read-only mapping)
         """
-        return {
-            "type": "two_local",
-            "reps": problem_config.get("ansatz_reps", 2),
-            "entanglement": "full"
-        }
+        return _build_ansatz(problem_config.get("ansatz_reps", 2))
     
     def _quantum_evaluate(self, params: np.ndarray, hamiltonian: np.ndarray, 
-                         ansatz: Dict) -> float:
+                         ansatz: Dict):
         """
         Quantum backend proxy - evaluates energy for given parameters.
         
         This is where quantum circuit would be created, run on quantum processor,
-        and energy expectation value computed.
+        and energy expectation value computed. Results are memoized by the
+        parameter vector (rounded to 8 decimals) in an LRU cache, since
+        optimizers revisit near-identical points close to convergence.
         
         Args:
-            params: Circuit parameters
+            params: Circuit parameters, or a (batch, n_params) matrix of them
             hamiltonian: Problem Hamiltonian
             ansatz: Circuit structure
         
         Returns:
-            Energy value (expectation value of Hamiltonian)
+            Energy value (expectation value of Hamiltonian), or an array with
+            one energy per row for batched input
         """
-        # In demo: return simulated energy
+        if params.ndim == 2:
+            return self._quantum_evaluate_batch(params, hamiltonian, ansatz)
+        
+        if self._key_buf.shape != params.shape:
+            self._key_buf = np.empty(params.shape)
+        key = np.round(params, 8, out=self._key_buf).tobytes()
+        energy = self._eval_cache.get(key)
+        if energy is not None:
+            self._eval_cache.move_to_end(key)
+            self._cache_hits += 1
+            return energy
+        self._cache_misses += 1
+        
+        # Simulated backend: exact state-vector expectation value (JIT-compiled)
         # In production: Would call actual quantum backend
-        energy = np.random.random() - 0.5
+        if self._use_gpu and isinstance(hamiltonian, cp.ndarray):
+            energy = self._quantum_evaluate_gpu(params, hamiltonian, ansatz)
+        elif hamiltonian.dtype in (np.float32, np.float64):
+            params = np.ascontiguousarray(params, dtype=hamiltonian.dtype)
+            kernel = _get_specialized_kernel(params.shape[0], ansatz["reps"])
+            energy = kernel(params, hamiltonian)
+        else:
+            # Numba has no bfloat16 type: prepare the state with the JIT kernel
+            # and contract with NumPy
+            params = np.ascontiguousarray(params, dtype=np.float32)
+            n_qubits = hamiltonian.shape[0].bit_length() - 1
+            psi = _apply_two_local(params, params.shape[0], n_qubits, ansatz["reps"])
+            energy = float(_contract_energies(psi[np.newaxis], hamiltonian)[0])
+        
+        self._eval_cache[key] = energy
+        if len(self._eval_cache) > self.EVAL_CACHE_SIZE:
+            self._eval_cache.popitem(last=False)
         return energy
     
+    def _quantum_evaluate_batch(self, params_batch: np.ndarray, hamiltonian: np.ndarray,
+                               ansatz: Dict) -> np.ndarray:
+        """
+        Evaluate energies for a batch of parameter vectors in one backend call.
+        
+        Mirrors grouped evaluation on real backends (Qiskit's max_evals_grouped):
+        cached rows are served from the evaluation cache, and the remaining
+        states are contracted against H with a single matrix product,
+        sum_ij psi_bi H_ij psi_bj, instead of one matvec per vector.
+        
+        Args:
+            params_batch: (batch, n_params) matrix of circuit parameters
+            hamiltonian: Problem Hamiltonian
+            ansatz: Circuit structure
+        
+        Returns:
+            Array of energies, one per row of params_batch
+        """
+        energies = np.empty(params_batch.shape[0])
+        keys = [row.tobytes() for row in np.round(params_batch, 8)]
+        misses = []
+        for i, key in enumerate(keys):
+            energy = self._eval_cache.get(key)
+            if energy is None:
+                misses.append(i)
+            else:
+                self._eval_cache.move_to_end(key)
+                energies[i] = energy
+        self._cache_hits += len(keys) - len(misses)
+        self._cache_misses += len(misses)
+        if not misses:
+            return energies
+        
+        pending = params_batch[misses]
+        if self._use_gpu and isinstance(hamiltonian, cp.ndarray):
+            computed = np.array([self._quantum_evaluate_gpu(row, hamiltonian, ansatz)
+                                 for row in pending])
+        else:
+            dtype = np.float64 if hamiltonian.dtype == np.float64 else np.float32
+            n_qubits = hamiltonian.shape[0].bit_length() - 1
+            states = _batch_two_local(np.ascontiguousarray(pending, dtype=dtype),
+                                      n_qubits, ansatz["reps"])
+            computed = _contract_energies(states, hamiltonian)
+        
+        energies[misses] = computed
+        for i, energy in zip(misses, computed.tolist()):
+            self._eval_cache[keys[i]] = energy
+        while len(self._eval_cache) > self.EVAL_CACHE_SIZE:
+            self._eval_cache.popitem(last=False)
+        return energies
+    
+    def _quantum_evaluate_gpu(self, params: np.ndarray, hamiltonian, ansatz: Dict) -> float:
+        """
+        CuPy evaluation of <psi|H|psi> with the Hamiltonian resident on the GPU.
+        
+        Work is issued on a non-blocking stream so it does not serialize with
+        the legacy default stream; the optimizer needs each energy before it
+        proposes the next parameters, so the final host read synchronizes.
+        
+        Args:
+            params: Circuit parameters (host array)
+            hamiltonian: Problem Hamiltonian (CuPy array)
+            ansatz: Circuit structure
+        
+        Returns:
+            Energy expectation value
+        """
+        n_qubits = hamiltonian.shape[0].bit_length() - 1
+        key = (n_qubits, hamiltonian.dtype)
+        with self._cuda_stream:
+            device_consts = self._device_ansatz_cache.get(key)
+            if device_consts is None:
+                phases = cp.asarray(_cz_phases(n_qubits), dtype=hamiltonian.dtype)
+                psi0 = cp.zeros(1 << n_qubits, dtype=hamiltonian.dtype)
+                psi0[0] = 1
+                device_consts = self._device_ansatz_cache[key] = (phases, psi0)
+            params_gpu = cp.asarray(params, dtype=hamiltonian.dtype)
+            psi = _two_local_statevector(params_gpu, n_qubits, ansatz["reps"], xp=cp,
+                                         phases=device_consts[0], psi0=device_consts[1])
+            psi = psi.astype(hamiltonian.dtype, copy=False)
+            energy = cp.dot(psi, hamiltonian @ psi)
+        return float(energy.get(stream=self._cuda_stream))
+    
     def get_backend_adapter(self, backend_type: str):
         """
         Adapter pattern: Get adapter for specified backend.
@@ -310,6 +1233,30 @@ class HybridQuantumOrchestrator:
         return "NVIDIA CUDA-Q Backend"
 
 
+def _run_one_vqe(problem_config: Dict, seed: int, max_iterations: int,
+                 backend_type: str, demo_mode: bool) -> Dict:
+    """
+    Process-pool entry point for a single multi-start VQE run.
+    
+    Kept at module level so it can be pickled by ProcessPoolExecutor. The
+    Hamiltonian is rebuilt (memoized per process) from problem_config["seed"].
+    
+    Args:
+        problem_config: Problem configuration, including the Hamiltonian seed
+        seed: Seed for the initial parameters
+        max_iterations: Maximum number of optimization iterations
+        backend_type: Quantum backend to use
+        demo_mode: See HybridQuantumOrchestrator
+    
+    Returns:
+        VQE results dictionary for this start
+    """
+    orchestrator = HybridQuantumOrchestrator(backend_type=backend_type, demo_mode=demo_mode)
+    hamiltonian = orchestrator._construct_hamiltonian(problem_config)
+    ansatz = orchestrator._construct_ansatz(problem_config)
+    return orchestrator._run_vqe(problem_config, hamiltonian, ansatz, max_iterations, seed)
+
+
 # ============================================================================
 # DP3: VALUE MEASUREMENT ENGINE
 # ============================================================================
@@ -323,7 +1270,17 @@ class ValueMeasurementEngine:
     def __init__(self):
         """Initialize value measurement engine with KPI templates."""
         self.kpi_templates = self._load_kpi_templates()
+        # Snapshot of the templates copied into every benchmark's metrics
+        self._kpi_frozen = {d: dict(t) for d, t in self.kpi_templates.items()}
         self.benchmarks = []
+        
+        # Per-benchmark headline metrics as parallel arrays for vectorized
+        # aggregation; grown geometrically, first _n_benchmarks entries valid
+        self._capacity = 16
+        self._n_benchmarks = 0
+        self._speedup = np.empty(self._capacity)
+        self._cost_red = np.empty(self._capacity)
+        self._domains = []
     
     def _load_kpi_templates(self) -> Dict:
         """
@@ -411,19 +1368,38 @@ class ValueMeasurementEngine:
         )
         
         # Apply domain-specific KPIs
-        if domain in self.kpi_templates:
-            kpi_keys = list(self.kpi_templates[domain].keys())
-            for key in kpi_keys:
-                benchmark["metrics"][key] = self.kpi_templates[domain][key]
+        if domain in self._kpi_frozen:
+            benchmark["metrics"].update(self._kpi_frozen[domain])
         
         self.benchmarks.append(benchmark)
+        self._append_metrics(benchmark["metrics"]["speedup_factor"],
+                             benchmark["metrics"]["cost_reduction_pct"], domain)
         print(f"✓ Benchmark created: {domain} domain, Speedup {benchmark['metrics']['speedup_factor']:.2f}x")
         return benchmark
     
+    def _append_metrics(self, speedup: float, cost_reduction: float, domain: str):
+        """
+        Append one benchmark's headline metrics to the aggregation arrays.
+        
+        Args:
+            speedup: Speedup factor
+            cost_reduction: Cost reduction percentage
+            domain: Application domain
+        """
+        if self._n_benchmarks == self._capacity:
+            self._capacity *= 2
+            self._speedup = np.resize(self._speedup, self._capacity)
+            self._cost_red = np.resize(self._cost_red, self._capacity)
+        self._speedup[self._n_benchmarks] = speedup
+        self._cost_red[self._n_benchmarks] = cost_reduction
+        self._domains.append(domain)
+        self._n_benchmarks += 1
+    
     def generate_kpi_dashboard(self) -> Dict:
         """
         Generate KPI Dashboard for stakeholder visibility.
-        Aggregates metrics across all benchmarks.
+        Aggregates metrics across all benchmarks (vectorized over the
+        per-benchmark metric arrays).
         
         Returns:
             Dashboard dictionary with aggregated metrics
@@ -431,12 +1407,17 @@ class ValueMeasurementEngine:
         if not self.benchmarks:
             return {"status": "No benchmarks yet"}
         
+        n = self._n_benchmarks
+        speedup = self._speedup[:n]
+        domains, domain_idx = np.unique(self._domains, return_inverse=True)
+        domain_speedup = (np.bincount(domain_idx, weights=speedup) /
+                          np.bincount(domain_idx))
+        
         dashboard = {
-            "total_runs": len(self.benchmarks),
-            "average_speedup": np.mean([b["metrics"]["speedup_factor"] 
-                                       for b in self.benchmarks]),
-            "average_cost_reduction_pct": np.mean([b["metrics"]["cost_reduction_pct"] 
-                                                   for b in self.benchmarks]),
+            "total_runs": n,
+            "average_speedup": float(speedup.mean()),
+            "average_cost_reduction_pct": float(self._cost_red[:n].mean()),
+            "domain_average_speedup": dict(zip(domains.tolist(), domain_speedup.tolist())),
             "domain_breakdown": {},
             "latest_benchmark": self.benchmarks[-1]
         }
@@ -455,6 +1436,19 @@ class ValueMeasurementEngine:
 # DP4: PLUGIN REGISTRY
 # ============================================================================
 
+@dataclass(slots=True)
+class DomainPlugin:
+    """
+    Registered domain plugin record.
+    
+    Attributes:
+        kpi_template: KPI template for the domain
+        workflows: Supported workflows
+    """
+    kpi_template: Dict
+    workflows: List
+
+
 class PluginRegistry:
     """
     Plugin Architecture for backend agnosticism and domain independence.
@@ -487,10 +1481,7 @@ class PluginRegistry:
             kpi_template: KPI template for domain
             workflows: List of supported workflows
         """
-        self.domain_plugins[domain] = {
-            "kpi_template": kpi_template,
-            "workflows": workflows
-        }
+        self.domain_plugins[domain] = DomainPlugin(kpi_template, workflows)
         print(f"✓ Registered domain plugin: {domain}")
     
     def get_quantum_backend(self, name: str):
@@ -513,7 +1504,7 @@ class PluginRegistry:
             domain: Domain name
         
         Returns:
-            Domain plugin dictionary
+            DomainPlugin record (None if not registered)
         """
         return self.domain_plugins.get(domain)
     
@@ -568,6 +1559,7 @@ def run_full_demo():
         role="quantum_specialist",
         action="execute_quantum"
     )
+    governance.flush_audit_log()
     print(f"  ✓ Access granted: {has_access}")
     
     governance.record_data_quality("drug_discovery_001", {
@@ -594,7 +1586,7 @@ def run_full_demo():
     hqc_result = orchestrator.execute_vqe_workflow(problem_config, max_iterations=20)
     print(f"  ✓ HQC Execution Complete:")
     print(f"    - Optimal Energy: {hqc_result['minimum_energy']:.4f}")
-    print(f"    - Iterations: {len(hqc_result['iterations'])}")
+    print(f"    - Iterations: {len(hqc_result['iterations']['energy'])}")
     
     # ========================================================================
     # STEP 3: Benchmark vs Classical (DP3)